@@ -79,6 +79,9 @@ func main() {
 		AllowCredentials: true,
 	}))
 
+	// 响应压缩（K线、股票列表等大体积JSON，小于1KB的响应不压缩）
+	r.Use(handler.GzipMiddleware(1024))
+
 	// 注册路由
 	api := r.Group("/api")
 	{
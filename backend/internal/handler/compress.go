@@ -0,0 +1,136 @@
+package handler
+
+import (
+	"bytes"
+	"compress/gzip"
+	"net/http"
+	"strconv"
+	"strings"
+	"sync"
+
+	"github.com/gin-gonic/gin"
+)
+
+var gzipWriterPool = sync.Pool{
+	New: func() any {
+		gz, _ := gzip.NewWriterLevel(nil, gzip.BestSpeed)
+		return gz
+	},
+}
+
+// gzipResponseWriter 先缓冲响应体，处理结束后再根据大小决定是否压缩
+type gzipResponseWriter struct {
+	gin.ResponseWriter
+	buf    bytes.Buffer
+	status int
+}
+
+func (w *gzipResponseWriter) WriteHeader(code int) {
+	w.status = code
+}
+
+func (w *gzipResponseWriter) WriteHeaderNow() {}
+
+func (w *gzipResponseWriter) Write(b []byte) (int, error) {
+	return w.buf.Write(b)
+}
+
+func (w *gzipResponseWriter) WriteString(s string) (int, error) {
+	return w.buf.WriteString(s)
+}
+
+func (w *gzipResponseWriter) Status() int {
+	if w.status != 0 {
+		return w.status
+	}
+	return w.ResponseWriter.Status()
+}
+
+func (w *gzipResponseWriter) Size() int {
+	return w.buf.Len()
+}
+
+func (w *gzipResponseWriter) Written() bool {
+	return w.status != 0 || w.buf.Len() > 0
+}
+
+func (w *gzipResponseWriter) finish(minSize int) {
+	if w.status == 0 && w.buf.Len() == 0 {
+		return
+	}
+	status := w.status
+	if status == 0 {
+		status = http.StatusOK
+	}
+	body := w.buf.Bytes()
+	h := w.ResponseWriter.Header()
+
+	if len(body) < minSize || h.Get("Content-Encoding") != "" {
+		w.ResponseWriter.WriteHeader(status)
+		if len(body) > 0 {
+			_, _ = w.ResponseWriter.Write(body)
+		}
+		return
+	}
+
+	h.Set("Content-Encoding", "gzip")
+	h.Del("Content-Length")
+	w.ResponseWriter.WriteHeader(status)
+
+	gz := gzipWriterPool.Get().(*gzip.Writer)
+	gz.Reset(w.ResponseWriter)
+	_, _ = gz.Write(body)
+	_ = gz.Close()
+	gzipWriterPool.Put(gz)
+}
+
+// acceptsGzip 解析 Accept-Encoding（含 q 值）：gzip 或 * 的 q>0 时视为支持，显式 gzip;q=0 表示拒绝
+func acceptsGzip(header string) bool {
+	wildcard := false
+	for _, part := range strings.Split(header, ",") {
+		name, params, _ := strings.Cut(strings.TrimSpace(part), ";")
+		name = strings.TrimSpace(name)
+		if !strings.EqualFold(name, "gzip") && name != "*" {
+			continue
+		}
+		q := 1.0
+		for _, p := range strings.Split(params, ";") {
+			k, v, ok := strings.Cut(strings.TrimSpace(p), "=")
+			if ok && strings.EqualFold(strings.TrimSpace(k), "q") {
+				if f, err := strconv.ParseFloat(strings.TrimSpace(v), 64); err == nil {
+					q = f
+				} else {
+					q = 0
+				}
+			}
+		}
+		if strings.EqualFold(name, "gzip") {
+			return q > 0
+		}
+		wildcard = q > 0
+	}
+	return wildcard
+}
+
+// GzipMiddleware 响应压缩中间件：客户端支持 gzip 且响应体不小于 minSize 字节时压缩
+// K线、股票列表等JSON响应体积较大且重复度高，压缩后通常只有原来的1/5~1/10
+func GzipMiddleware(minSize int) gin.HandlerFunc {
+	return func(c *gin.Context) {
+		// 是否压缩取决于 Accept-Encoding，无论本次是否压缩都需告知缓存按该请求头区分
+		c.Writer.Header().Add("Vary", "Accept-Encoding")
+		if !acceptsGzip(c.GetHeader("Accept-Encoding")) {
+			c.Next()
+			return
+		}
+
+		w := &gzipResponseWriter{ResponseWriter: c.Writer}
+		c.Writer = w
+		// panic 时只还原 Writer，交由 Recovery 直接写错误响应
+		defer func() { c.Writer = w.ResponseWriter }()
+
+		c.Next()
+
+		c.Writer = w.ResponseWriter
+		w.finish(minSize)
+	}
+}
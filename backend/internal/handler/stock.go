@@ -9,6 +9,23 @@ import (
 	"github.com/gin-gonic/gin"
 )
 
+// StockListResponse 股票列表响应
+// 成功响应使用具名结构体而非 gin.H：结构体的编码方式可被序列化库缓存，无需每次反射遍历并排序 map 键
+type StockListResponse struct {
+	Data      []stockdata.Stock `json:"data"`
+	FromCache bool              `json:"fromCache"`
+}
+
+// NewsResponse 股票新闻响应
+type NewsResponse struct {
+	Data []stockdata.NewsItem `json:"data"`
+}
+
+// ConfigResponse 系统配置响应
+type ConfigResponse struct {
+	RefreshAvailableTime string `json:"refresh_available_time"`
+}
+
 // GetStocks 获取股票列表（始终从缓存获取）
 func GetStocks(c *gin.Context) {
 	keyword := c.Query("keyword")
@@ -24,13 +41,14 @@ func GetStocks(c *gin.Context) {
 		return
 	}
 
-	c.JSON(http.StatusOK, gin.H{
-		"data":      stocks,
-		"fromCache": true,
+	c.JSON(http.StatusOK, StockListResponse{
+		Data:      stocks,
+		FromCache: true,
 	})
 }
 
 // GetKline 获取K线数据
+// 查询参数 format：records（默认，data 为K线对象数组）/ columnar（data 为按字段分列的数组）
 func GetKline(c *gin.Context) {
 	code := c.Param("code")
 	period := c.DefaultQuery("period", "daily")
@@ -49,6 +67,12 @@ func GetKline(c *gin.Context) {
 		return
 	}
 
+	// format=columnar 返回列式数据（字段名不随K线条数重复）；默认仍为逐条记录
+	if c.Query("format") == "columnar" {
+		c.JSON(http.StatusOK, kline.Columns())
+		return
+	}
+
 	c.JSON(http.StatusOK, kline)
 }
 
@@ -79,8 +103,8 @@ func GetNews(c *gin.Context) {
 		return
 	}
 
-	c.JSON(http.StatusOK, gin.H{
-		"data": news,
+	c.JSON(http.StatusOK, NewsResponse{
+		Data: news,
 	})
 }
 
@@ -92,7 +116,7 @@ func GetConfig(c *gin.Context) {
 		refreshAvailableTime = "17:00"
 	}
 
-	c.JSON(http.StatusOK, gin.H{
-		"refresh_available_time": refreshAvailableTime,
+	c.JSON(http.StatusOK, ConfigResponse{
+		RefreshAvailableTime: refreshAvailableTime,
 	})
 }
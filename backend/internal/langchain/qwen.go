@@ -35,6 +35,15 @@ var (
 
 var llmConfigOnce sync.Once
 
+// llmHTTPTransport LLM请求共享连接池（各调用超时不同，Client 按需创建，但复用同一 Transport 的 keep-alive 连接）
+var llmHTTPTransport = func() *http.Transport {
+	t := http.DefaultTransport.(*http.Transport).Clone()
+	t.MaxIdleConns = 32
+	t.MaxIdleConnsPerHost = 16
+	t.IdleConnTimeout = 90 * time.Second
+	return t
+}()
+
 func ensureLLMConfig() {
 	llmConfigOnce.Do(loadLLMConfig)
 }
@@ -131,7 +140,7 @@ func callChatCompletions(messages []Message, timeout time.Duration) (string, err
 	httpReq.Header.Set("Content-Type", "application/json")
 	httpReq.Header.Set("Authorization", "Bearer "+llmAuthToken)
 
-	client := &http.Client{Timeout: timeout}
+	client := &http.Client{Timeout: timeout, Transport: llmHTTPTransport}
 	resp, err := client.Do(httpReq)
 	if err != nil {
 		return "", fmt.Errorf("请求失败: %v", err)
@@ -186,11 +195,21 @@ type newsImpactCacheItem struct {
 	ExpiresAt time.Time
 }
 
+type classificationCacheItem struct {
+	Value     StockClassification
+	ExpiresAt time.Time
+}
+
+// classificationCacheTTL 板块归属基本不随行情变化，缓存一周即可
+const classificationCacheTTL = 7 * 24 * time.Hour
+
 var (
-	ohlcvCacheMu      sync.Mutex
-	ohlcvCache        = map[string]ohlcvCacheItem{}
-	newsImpactCacheMu sync.Mutex
-	newsImpactCache   = map[string]newsImpactCacheItem{}
+	ohlcvCacheMu          sync.Mutex
+	ohlcvCache            = map[string]ohlcvCacheItem{}
+	newsImpactCacheMu     sync.Mutex
+	newsImpactCache       = map[string]newsImpactCacheItem{}
+	classificationCacheMu sync.Mutex
+	classificationCache   = map[string]classificationCacheItem{}
 )
 
 func ohlcvCacheKey(modelName string, prompt string) string {
@@ -206,6 +225,10 @@ func newsImpactDayCacheKey(modelName, code, today, newsKey string) string {
 	return fmt.Sprintf("llm:news_impact:day:%s:%s:%s:%s", modelName, code, today, newsKey)
 }
 
+func classificationCacheKey(modelName, code string) string {
+	return "llm:classification:" + modelName + ":" + code
+}
+
 func newsImpactKey(news []NewsItem) string {
 	if len(news) == 0 {
 		return ""
@@ -1408,6 +1431,17 @@ func GetStockClassification(code, name string) StockClassification {
 		return StockClassification{}
 	}
 
+	cacheKey := classificationCacheKey(llmModel, code)
+	classificationCacheMu.Lock()
+	item, ok := classificationCache[cacheKey]
+	classificationCacheMu.Unlock()
+	if ok && time.Now().Before(item.ExpiresAt) {
+		if llmDebugSamples {
+			log.Printf("[DEBUG][LLM][classification_cache] hit=mem code=%s", code)
+		}
+		return item.Value
+	}
+
 	result, err := callChatCompletions([]Message{
 		{
 			Role: "system",
@@ -1446,6 +1480,13 @@ func GetStockClassification(code, name string) StockClassification {
 		}
 	}
 
+	// 只缓存有效结果，失败时下次请求仍会重试
+	if strings.TrimSpace(classification.Sector) != "" {
+		classificationCacheMu.Lock()
+		classificationCache[cacheKey] = classificationCacheItem{Value: classification, ExpiresAt: time.Now().Add(classificationCacheTTL)}
+		classificationCacheMu.Unlock()
+	}
+
 	return classification
 }
 
@@ -1747,7 +1788,7 @@ func callLLMForIntegratedPrediction(prompt string) (*IntegratedPredictionResult,
 	req.Header.Set("Content-Type", "application/json")
 	req.Header.Set("Authorization", "Bearer "+llmAuthToken)
 
-	client := &http.Client{Timeout: 30 * time.Second}
+	client := &http.Client{Timeout: 30 * time.Second, Transport: llmHTTPTransport}
 	resp, err := client.Do(req)
 	if err != nil {
 		return nil, fmt.Errorf("http request: %v", err)
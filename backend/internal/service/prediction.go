@@ -305,21 +305,6 @@ func predictSingleStock(code, period string, isBatch bool) (*model.PredictResult
 		stockName = stockInfo.Name
 		industry = stockInfo.Industry
 	}
-	// 如果缓存中没有行业信息，尝试从东方财富获取
-	if industry == "" {
-		industry = stockdata.GetStockIndustry(code)
-	}
-	// 如果东方财富也获取失败，使用LLM获取板块和行业
-	if !isBatch && (sector == "" || industry == "") && stockName != "未知" {
-		classification := langchain.GetStockClassification(code, stockName)
-		if sector == "" {
-			sector = classification.Sector
-		}
-		if industry == "" {
-			industry = classification.Industry
-		}
-	}
-
 	// 2. 获取技术指标
 	isTradingTime := isTradingTimeNow()
 	kline, err := stockdata.GetKlineWithRefresh(code, "daily", isTradingTime)
@@ -360,6 +345,28 @@ func predictSingleStock(code, period string, isBatch bool) (*model.PredictResult
 		return nil, fmt.Errorf("获取技术指标失败: 返回数据为空")
 	}
 
+	// 行业/板块查询与后续新闻获取、LLM分析互不依赖，放到后台并发执行
+	// （在K线和指标成功之后启动，避免提前返回错误时仍在后台请求行业接口/LLM）
+	// sector/industry 仅在返回结果前读取（需先等待 classifyDone）
+	classifyDone := make(chan struct{})
+	go func() {
+		defer close(classifyDone)
+		// 如果缓存中没有行业信息，尝试从东方财富获取（上面已查过股票列表，直接请求接口）
+		if industry == "" {
+			industry = stockdata.FetchStockIndustry(code)
+		}
+		// 如果东方财富也获取失败，使用LLM获取板块和行业
+		if !isBatch && (sector == "" || industry == "") && stockName != "未知" {
+			classification := langchain.GetStockClassification(code, stockName)
+			if sector == "" {
+				sector = classification.Sector
+			}
+			if industry == "" {
+				industry = classification.Industry
+			}
+		}
+	}()
+
 	var indicatorsForTodayPred *stockdata.Indicators
 	if hasTodayData && len(kline.Data) >= 2 {
 		indicatorsForTodayPred, _ = stockdata.CalculateIndicatorsWithIndex(code, kline.Data[:len(kline.Data)-1])
@@ -380,8 +387,19 @@ func predictSingleStock(code, period string, isBatch bool) (*model.PredictResult
 	if isBatch {
 		analysis = "批量模式为加速已跳过详细AI分析，点进单股查看"
 	} else {
-		annItems, _ := stockdata.GetStockNews(code, 5)
-		mediaItems, _ := stockdata.GetStockMediaNews(code, 10)
+		// 公告与媒体新闻互不依赖，并发请求以重叠网络等待
+		var annItems, mediaItems []stockdata.NewsItem
+		var newsWg sync.WaitGroup
+		newsWg.Add(2)
+		go func() {
+			defer newsWg.Done()
+			annItems, _ = stockdata.GetStockNews(code, 5)
+		}()
+		go func() {
+			defer newsWg.Done()
+			mediaItems, _ = stockdata.GetStockMediaNews(code, 10)
+		}()
+		newsWg.Wait()
 
 		annNews := make([]langchain.NewsItem, 0, len(annItems))
 		for _, n := range annItems {
@@ -393,9 +411,17 @@ func predictSingleStock(code, period string, isBatch bool) (*model.PredictResult
 		}
 		news = mergeNewsForLLM(annNews, mediaNews, 15)
 
-		newsImpact = langchain.AnalyzeNewsImpact(code, stockName, news)
-		analysis, err = langchain.AnalyzeStock(code, stockName, techIndicators, mlPredictions, signals, news)
-		if err != nil {
+		// 新闻影响评估与综合分析是两次独立的LLM调用，并发执行，耗时取两者较大值
+		var analysisErr error
+		var llmWg sync.WaitGroup
+		llmWg.Add(1)
+		go func() {
+			defer llmWg.Done()
+			newsImpact = langchain.AnalyzeNewsImpact(code, stockName, news)
+		}()
+		analysis, analysisErr = langchain.AnalyzeStock(code, stockName, techIndicators, mlPredictions, signals, news)
+		llmWg.Wait()
+		if analysisErr != nil {
 			analysis = "AI分析暂时不可用"
 		}
 		newsAnalysis = generateNewsAnalysis(newsImpact, news)
@@ -610,6 +636,8 @@ func predictSingleStock(code, period string, isBatch bool) (*model.PredictResult
 		}
 	}
 
+	<-classifyDone
+
 	return &model.PredictResult{
 		StockCode:    code,
 		StockName:    stockName,
@@ -93,10 +93,13 @@ func CalculateIndicators(data []KlineData) (*Indicators, error) {
 		return nil, fmt.Errorf("K线数据为空")
 	}
 
-	closes := make([]float64, len(data))
-	highs := make([]float64, len(data))
-	lows := make([]float64, len(data))
-	volumes := make([]float64, len(data))
+	// 四列共用一块连续内存，一次分配（保持float64：价格/成交量降为float32会改变指标结果）
+	m := len(data)
+	buf := make([]float64, 4*m)
+	closes := buf[0:m:m]
+	highs := buf[m : 2*m : 2*m]
+	lows := buf[2*m : 3*m : 3*m]
+	volumes := buf[3*m : 4*m : 4*m]
 	for i, d := range data {
 		closes[i] = d.Close
 		highs[i] = d.High
@@ -131,27 +134,13 @@ func CalculateIndicators(data []KlineData) (*Indicators, error) {
 
 	// 支撑位和压力位
 	lookback := min(20, n)
-	ind.SupportLevel = minSlice(lows[n-lookback:])
-	ind.ResistanceLevel = maxSlice(highs[n-lookback:])
+	ind.SupportLevel, ind.ResistanceLevel = lowHighRange(lows[n-lookback:], highs[n-lookback:])
 
 	// 动量指标
-	if n >= 2 {
-		ind.Change1D = (closes[n-1] - closes[n-2]) / closes[n-2] * 100
-	}
-	if n >= 6 {
-		ind.Change5D = (closes[n-1] - closes[n-6]) / closes[n-6] * 100
-	}
-	if n >= 11 {
-		ind.Change10D = (closes[n-1] - closes[n-11]) / closes[n-11] * 100
-	}
-	// MA5斜率（最近3天MA5的变化率）
-	if n >= 8 {
-		ma5Today := calculateMA(closes, 5)
-		ma5_3DaysAgo := calculateMA(closes[:n-3], 5)
-		if ma5_3DaysAgo > 0 {
-			ind.MA5Slope = (ma5Today - ma5_3DaysAgo) / ma5_3DaysAgo * 100
-		}
-	}
+	ind.Change1D = calculateChangePercent(closes, 1)
+	ind.Change5D = calculateChangePercent(closes, 5)
+	ind.Change10D = calculateChangePercent(closes, 10)
+	ind.MA5Slope = calculateMA5Slope(closes)
 
 	// 成交量指标
 	ind.CurrentVolume = volumes[n-1]
@@ -217,109 +206,139 @@ func calculateMA(data []float64, period int) float64 {
 	return sum / float64(period)
 }
 
-// calculateEMA 计算指数移动平均
-func calculateEMA(data []float64, period int) []float64 {
-	if len(data) < period {
-		return nil
+// calculateChangePercent 计算最近 days 日涨跌幅（%），数据不足时返回0
+func calculateChangePercent(closes []float64, days int) float64 {
+	n := len(closes)
+	if n < days+1 {
+		return 0
 	}
+	return (closes[n-1] - closes[n-1-days]) / closes[n-1-days] * 100
+}
 
-	ema := make([]float64, len(data))
-	multiplier := 2.0 / float64(period+1)
-
-	// 第一个EMA使用SMA
-	sum := 0.0
-	for i := 0; i < period; i++ {
-		sum += data[i]
+// calculateMA5Slope 计算MA5斜率（最近3天MA5的变化率，%）
+func calculateMA5Slope(closes []float64) float64 {
+	n := len(closes)
+	if n < 8 {
+		return 0
 	}
-	ema[period-1] = sum / float64(period)
-
-	// 后续使用EMA公式
-	for i := period; i < len(data); i++ {
-		ema[i] = (data[i]-ema[i-1])*multiplier + ema[i-1]
+	ma5Today := calculateMA(closes, 5)
+	ma5_3DaysAgo := calculateMA(closes[:n-3], 5)
+	if ma5_3DaysAgo > 0 {
+		return (ma5Today - ma5_3DaysAgo) / ma5_3DaysAgo * 100
 	}
+	return 0
+}
+
+// emaStream 流式指数移动平均：前 period 个数据取SMA作为初值，之后按EMA公式递推，无需保存整条序列
+type emaStream struct {
+	period     int
+	multiplier float64
+	count      int
+	sum        float64
+	value      float64
+}
 
-	return ema
+func newEMAStream(period int) emaStream {
+	return emaStream{period: period, multiplier: 2.0 / float64(period+1)}
+}
+
+// push 输入下一个数据点，返回EMA是否已有有效值
+func (e *emaStream) push(x float64) bool {
+	if e.count < e.period {
+		e.sum += x
+		e.count++
+		if e.count < e.period {
+			return false
+		}
+		// 第一个EMA使用SMA
+		e.value = e.sum / float64(e.period)
+		return true
+	}
+	e.value = (x-e.value)*e.multiplier + e.value
+	return true
 }
 
 // calculateMACD 计算MACD
+// EMA12/EMA26/DEA 在同一次遍历中递推，不再为每条均线和DIF分配整段切片
 func calculateMACD(closes []float64) (macd, signal, hist float64) {
 	if len(closes) < 26 {
 		return 0, 0, 0
 	}
 
-	ema12 := calculateEMA(closes, 12)
-	ema26 := calculateEMA(closes, 26)
+	ema12 := newEMAStream(12)
+	ema26 := newEMAStream(26)
+	// DEA = EMA9(DIF)，DIF = EMA12 - EMA26（EMA26就绪后才有效）
+	dea := newEMAStream(9)
 
-	if ema12 == nil || ema26 == nil {
-		return 0, 0, 0
-	}
-
-	// DIF = EMA12 - EMA26（只计算有效部分）
-	validStart := 25 // EMA26需要26个数据点，索引从25开始
-	dif := make([]float64, len(closes)-validStart)
-	for i := validStart; i < len(closes); i++ {
-		dif[i-validStart] = ema12[i] - ema26[i]
+	var dif float64
+	deaReady := false
+	for _, c := range closes {
+		ema12.push(c)
+		if ema26.push(c) {
+			dif = ema12.value - ema26.value
+			deaReady = dea.push(dif)
+		}
 	}
-
-	// DEA = EMA9(DIF)
-	dea := calculateEMA(dif, 9)
-	if dea == nil || len(dea) == 0 {
+	if !deaReady {
 		return 0, 0, 0
 	}
 
 	// 取最后的值
-	macd = dif[len(dif)-1]
-	signal = dea[len(dea)-1]
+	macd = dif
+	signal = dea.value
 	hist = macd - signal // 标准MACD柱状图不需要乘以2
 
 	return macd, signal, hist
 }
 
 // calculateRSI 计算RSI（标准算法，使用EMA平滑）
+// 单次遍历收盘价，不再分配涨跌幅/涨幅/跌幅中间切片
 func calculateRSI(closes []float64, period int) float64 {
 	if len(closes) < period+1 {
 		return 50
 	}
 
-	// 计算价格变化
-	changes := make([]float64, len(closes)-1)
-	for i := 1; i < len(closes); i++ {
-		changes[i-1] = closes[i] - closes[i-1]
-	}
+	avgGain, avgLoss := initialRSIAverages(closes, period)
 
-	if len(changes) < period {
-		return 50
+	// 使用EMA方式计算后续的平均涨跌幅
+	alpha := 1.0 / float64(period) // EMA平滑因子
+	for i := period + 1; i < len(closes); i++ {
+		avgGain, avgLoss = smoothRSIAverages(avgGain, avgLoss, closes[i]-closes[i-1], alpha)
 	}
 
-	// 分离涨跌
-	gains := make([]float64, len(changes))
-	losses := make([]float64, len(changes))
-	for i, change := range changes {
+	return rsiFromAverages(avgGain, avgLoss)
+}
+
+// initialRSIAverages 计算初始平均涨跌幅（前period个涨跌幅的简单平均）
+func initialRSIAverages(closes []float64, period int) (avgGain, avgLoss float64) {
+	for i := 1; i <= period; i++ {
+		change := closes[i] - closes[i-1]
 		if change > 0 {
-			gains[i] = change
-			losses[i] = 0
+			avgGain += change
 		} else {
-			gains[i] = 0
-			losses[i] = -change
+			avgLoss += -change
 		}
 	}
-
-	// 计算初始平均涨跌幅（前period个数据的简单平均）
-	var avgGain, avgLoss float64
-	for i := 0; i < period; i++ {
-		avgGain += gains[i]
-		avgLoss += losses[i]
-	}
 	avgGain /= float64(period)
 	avgLoss /= float64(period)
+	return avgGain, avgLoss
+}
 
-	// 使用EMA方式计算后续的平均涨跌幅
-	alpha := 1.0 / float64(period) // EMA平滑因子
-	for i := period; i < len(gains); i++ {
-		avgGain = alpha*gains[i] + (1-alpha)*avgGain
-		avgLoss = alpha*losses[i] + (1-alpha)*avgLoss
+// smoothRSIAverages 用一个新的涨跌幅更新平均涨跌幅
+func smoothRSIAverages(avgGain, avgLoss, change, alpha float64) (float64, float64) {
+	gain, loss := 0.0, 0.0
+	if change > 0 {
+		gain = change
+	} else {
+		loss = -change
 	}
+	avgGain = alpha*gain + (1-alpha)*avgGain
+	avgLoss = alpha*loss + (1-alpha)*avgLoss
+	return avgGain, avgLoss
+}
 
+// rsiFromAverages 由平均涨跌幅计算RSI
+func rsiFromAverages(avgGain, avgLoss float64) float64 {
 	if avgLoss == 0 {
 		return 100
 	}
@@ -338,51 +357,31 @@ func calculateRSI(closes []float64, period int) float64 {
 }
 
 // calculateKDJ 计算KDJ（标准算法）
+// K、D在同一次遍历中递推，不再保存RSV/K序列
 func calculateKDJ(highs, lows, closes []float64) (k, d, j float64) {
 	period := 9
 	if len(closes) < period {
 		return 50, 50, 50
 	}
 
-	// 计算所有RSV值
-	rsvs := make([]float64, 0)
 	for i := period - 1; i < len(closes); i++ {
 		// 取当前位置往前period个数据
-		periodHighs := highs[i-period+1 : i+1]
-		periodLows := lows[i-period+1 : i+1]
-
-		highest := maxSlice(periodHighs)
-		lowest := minSlice(periodLows)
-		close := closes[i]
+		lowest, highest := lowHighRange(lows[i-period+1:i+1], highs[i-period+1:i+1])
 
 		rsv := 50.0
 		if highest != lowest {
-			rsv = (close - lowest) / (highest - lowest) * 100
+			rsv = (closes[i] - lowest) / (highest - lowest) * 100
 		}
-		rsvs = append(rsvs, rsv)
-	}
-
-	if len(rsvs) == 0 {
-		return 50, 50, 50
-	}
-
-	// 计算K值（RSV的EMA，平滑因子1/3）
-	k = rsvs[0] // 初始K值等于第一个RSV
-	for i := 1; i < len(rsvs); i++ {
-		k = (2.0/3.0)*k + (1.0/3.0)*rsvs[i]
-	}
-
-	// 计算D值（K值的EMA，平滑因子1/3）
-	// 为了计算D值，我们需要维护K值序列
-	ks := make([]float64, len(rsvs))
-	ks[0] = rsvs[0]
-	for i := 1; i < len(rsvs); i++ {
-		ks[i] = (2.0/3.0)*ks[i-1] + (1.0/3.0)*rsvs[i]
-	}
 
-	d = ks[0] // 初始D值等于第一个K值
-	for i := 1; i < len(ks); i++ {
-		d = (2.0/3.0)*d + (1.0/3.0)*ks[i]
+		if i == period-1 {
+			// 初始K值等于第一个RSV，初始D值等于第一个K值
+			k = rsv
+			d = k
+			continue
+		}
+		// K值为RSV的EMA，D值为K值的EMA（平滑因子1/3）
+		k = (2.0/3.0)*k + (1.0/3.0)*rsv
+		d = (2.0/3.0)*d + (1.0/3.0)*k
 	}
 
 	// 计算J值
@@ -418,7 +417,8 @@ func calculateBollinger(closes []float64, period int) (upper, middle, lower floa
 	// 计算标准差
 	sum := 0.0
 	for i := len(closes) - period; i < len(closes); i++ {
-		sum += math.Pow(closes[i]-middle, 2)
+		diff := closes[i] - middle
+		sum += diff * diff
 	}
 	std := math.Sqrt(sum / float64(period))
 
@@ -656,32 +656,22 @@ func generateSignals(ind *Indicators) []Signal {
 	return signals
 }
 
-// minSlice 求最小值
-func minSlice(data []float64) float64 {
-	if len(data) == 0 {
-		return 0
+// lowHighRange 一次遍历同时求最低价序列的最小值与最高价序列的最大值（两者等长）
+func lowHighRange(lows, highs []float64) (lowest, highest float64) {
+	if len(lows) == 0 {
+		return 0, 0
 	}
-	min := data[0]
-	for _, v := range data {
-		if v < min {
-			min = v
+	highs = highs[:len(lows)]
+	lowest, highest = lows[0], highs[0]
+	for i, l := range lows {
+		if l < lowest {
+			lowest = l
 		}
-	}
-	return min
-}
-
-// maxSlice 求最大值
-func maxSlice(data []float64) float64 {
-	if len(data) == 0 {
-		return 0
-	}
-	max := data[0]
-	for _, v := range data {
-		if v > max {
-			max = v
+		if h := highs[i]; h > highest {
+			highest = h
 		}
 	}
-	return max
+	return lowest, highest
 }
 
 // GetIndicators 获取股票技术指标
@@ -736,28 +726,39 @@ func detectPriceVolumeDiv(prices, volumes []float64) string {
 	return "neutral"
 }
 
-// calculateSlope 计算数据的斜率（简单线性回归）
-func calculateSlope(data []float64) float64 {
-	n := len(data)
-	if n < 2 {
-		return 0
-	}
+// regressionSums 简单线性回归（x=0..n-1）所需的各项累加和，一次遍历得到斜率、R²及均值/方差
+type regressionSums struct {
+	n                               float64
+	sumX, sumY, sumXY, sumX2, sumY2 float64
+}
 
-	// 计算x和y的平均值
-	var sumX, sumY, sumXY, sumX2 float64
+func accumulateRegression(data []float64) regressionSums {
+	n := float64(len(data))
+	// x 固定为 0..n-1，Σx 与 Σx² 直接用闭式求和（整数值，float64 下精确），循环只累加与 y 相关的项
+	s := regressionSums{
+		n:     n,
+		sumX:  n * (n - 1) / 2,
+		sumX2: (n - 1) * n * (2*n - 1) / 6,
+	}
 	for i, y := range data {
 		x := float64(i)
-		sumX += x
-		sumY += y
-		sumXY += x * y
-		sumX2 += x * x
+		s.sumY += y
+		s.sumXY += x * y
+		s.sumY2 += y * y
+	}
+	return s
+}
+
+// normalizedSlope 斜率 slope = (n*sumXY - sumX*sumY) / (n*sumX2 - sumX*sumX)，并标准化为相对变化率
+func (s regressionSums) normalizedSlope() float64 {
+	if s.n < 2 {
+		return 0
 	}
 
-	avgY := sumY / float64(n)
+	avgY := s.sumY / s.n
 
-	// 计算斜率 slope = (n*sumXY - sumX*sumY) / (n*sumX2 - sumX*sumX)
-	numerator := float64(n)*sumXY - sumX*sumY
-	denominator := float64(n)*sumX2 - sumX*sumX
+	numerator := s.n*s.sumXY - s.sumX*s.sumY
+	denominator := s.n*s.sumX2 - s.sumX*s.sumX
 
 	if denominator == 0 {
 		return 0
@@ -773,6 +774,32 @@ func calculateSlope(data []float64) float64 {
 	return 0
 }
 
+// rSquared 趋势强度（R²相关系数）
+func (s regressionSums) rSquared() float64 {
+	if s.n < 3 {
+		return 0
+	}
+
+	// 计算相关系数
+	numerator := s.n*s.sumXY - s.sumX*s.sumY
+	denominatorX := s.n*s.sumX2 - s.sumX*s.sumX
+	denominatorY := s.n*s.sumY2 - s.sumY*s.sumY
+
+	if denominatorX <= 0 || denominatorY <= 0 {
+		return 0
+	}
+
+	correlation := numerator / math.Sqrt(denominatorX*denominatorY)
+
+	// R² = correlation²
+	return correlation * correlation
+}
+
+// calculateSlope 计算数据的斜率（简单线性回归）
+func calculateSlope(data []float64) float64 {
+	return accumulateRegression(data).normalizedSlope()
+}
+
 // calculateVolumeStrength 计算成交量强度
 func calculateVolumeStrength(volumes []float64) float64 {
 	if len(volumes) < 10 {
@@ -814,25 +841,29 @@ func calculateDynamicRSIThresholds(closes []float64) (upper, lower float64) {
 	}
 
 	// 计算最近30天的RSI值
-	rsiValues := make([]float64, 0)
-	for i := 14; i < len(closes) && i < 30; i++ {
-		rsi := calculateRSI(closes[:i+1], 14)
-		rsiValues = append(rsiValues, rsi)
-	}
-
-	if len(rsiValues) < 10 {
-		return 70, 30
-	}
-
-	// 计算RSI的统计特征
+	// 前缀closes[:i+1]的RSI只比closes[:i]多一步平滑，递推计算而非每个前缀重算
+	const period = 14
+	alpha := 1.0 / float64(period)
+	avgGain, avgLoss := initialRSIAverages(closes, period)
 	var sum, sumSquares float64
-	for _, rsi := range rsiValues {
+	count := 0
+	for i := period; i < len(closes) && i < 30; i++ {
+		if i > period {
+			avgGain, avgLoss = smoothRSIAverages(avgGain, avgLoss, closes[i]-closes[i-1], alpha)
+		}
+		rsi := rsiFromAverages(avgGain, avgLoss)
+		// 计算RSI的统计特征
 		sum += rsi
 		sumSquares += rsi * rsi
+		count++
 	}
 
-	mean := sum / float64(len(rsiValues))
-	variance := (sumSquares / float64(len(rsiValues))) - (mean * mean)
+	if count < 10 {
+		return 70, 30
+	}
+
+	mean := sum / float64(count)
+	variance := (sumSquares / float64(count)) - (mean * mean)
 	stdDev := math.Sqrt(variance)
 
 	// 根据历史RSI分布动态调整阈值
@@ -857,23 +888,19 @@ func analyzeMarketEnvironment(closes, volumes []float64) (trend string, volatili
 		return "sideways", 0.1, 0.5
 	}
 
-	// 计算价格波动率（最近20天的标准差）
+	// 计算价格波动率（最近20天的标准差）、趋势方向和强度
+	// 线性回归与方差共用同一组累加和，一次遍历完成
 	recent := closes[len(closes)-20:]
-	var sum, sumSquares float64
-	for _, price := range recent {
-		sum += price
-		sumSquares += price * price
-	}
-	mean := sum / float64(len(recent))
-	variance := (sumSquares / float64(len(recent))) - (mean * mean)
+	reg := accumulateRegression(recent)
+	mean := reg.sumY / reg.n
+	variance := (reg.sumY2 / reg.n) - (mean * mean)
 	volatility = math.Sqrt(variance) / mean // 相对波动率
 
-	// 计算趋势方向和强度
 	// 使用线性回归分析最近20天的价格趋势
-	slope := calculateSlope(recent)
+	slope := reg.normalizedSlope()
 
 	// 计算趋势强度（R²相关系数）
-	trendStrength = calculateTrendStrength(recent)
+	trendStrength = reg.rSquared()
 
 	// 根据斜率和强度判断市场趋势
 	slopeThreshold := 0.02 // 2%的趋势阈值
@@ -892,41 +919,6 @@ func analyzeMarketEnvironment(closes, volumes []float64) (trend string, volatili
 	return trend, volatility, trendStrength
 }
 
-// calculateTrendStrength 计算趋势强度（R²相关系数）
-func calculateTrendStrength(data []float64) float64 {
-	n := len(data)
-	if n < 3 {
-		return 0
-	}
-
-	// 计算线性回归的R²
-	var sumX, sumY, sumXY, sumX2, sumY2 float64
-	for i, y := range data {
-		x := float64(i)
-		sumX += x
-		sumY += y
-		sumXY += x * y
-		sumX2 += x * x
-		sumY2 += y * y
-	}
-
-	// 计算相关系数
-	numerator := float64(n)*sumXY - sumX*sumY
-	denominatorX := float64(n)*sumX2 - sumX*sumX
-	denominatorY := float64(n)*sumY2 - sumY*sumY
-
-	if denominatorX <= 0 || denominatorY <= 0 {
-		return 0
-	}
-
-	correlation := numerator / math.Sqrt(denominatorX*denominatorY)
-
-	// R² = correlation²
-	rSquared := correlation * correlation
-
-	return rSquared
-}
-
 // detectBollingerBreakout 检测布林带突破
 func detectBollingerBreakout(closes []float64, bollUpper, bollLower, currentPrice float64) string {
 	if len(closes) < 3 {
@@ -1220,11 +1212,7 @@ func calculateMainForceCost(data []KlineData) (cost20, cost60 float64) {
 	// 短期主力成本：过去90天最低价 × 1.15
 	period20 := min(90, n)
 	if period20 >= 20 {
-		lows := make([]float64, period20)
-		for i := 0; i < period20; i++ {
-			lows[i] = data[n-period20+i].Low
-		}
-		minLow := minSlice(lows)
+		minLow := minKlineLow(data[n-period20:])
 		cost20 = minLow * 1.15 // 假设主力在底部上方15%建仓
 	} else {
 		// 数据太少，使用当前价的80%作为估计
@@ -1234,11 +1222,7 @@ func calculateMainForceCost(data []KlineData) (cost20, cost60 float64) {
 	// 中长期主力成本：过去180天最低价 × 1.18
 	period60 := min(180, n)
 	if period60 >= 60 {
-		lows := make([]float64, period60)
-		for i := 0; i < period60; i++ {
-			lows[i] = data[n-period60+i].Low
-		}
-		minLow := minSlice(lows)
+		minLow := minKlineLow(data[n-period60:])
 		cost60 = minLow * 1.18 // 假设主力在底部上方18%建仓
 	} else if period60 >= 20 {
 		// 数据不足180天，使用短期成本
@@ -1251,6 +1235,20 @@ func calculateMainForceCost(data []KlineData) (cost20, cost60 float64) {
 	return cost20, cost60
 }
 
+// minKlineLow 求K线窗口内的最低价（直接读取窗口，不复制到临时切片）
+func minKlineLow(window []KlineData) float64 {
+	if len(window) == 0 {
+		return 0
+	}
+	low := window[0].Low
+	for _, d := range window {
+		if d.Low < low {
+			low = d.Low
+		}
+	}
+	return low
+}
+
 // calculateCostDeviation 计算成本偏离度
 func calculateCostDeviation(currentPrice, cost float64) float64 {
 	if cost == 0 {
@@ -1267,29 +1265,21 @@ func calculateChipConcentration(data []KlineData) float64 {
 	}
 
 	// 使用最近20天的价格分布计算集中度
-	period := min(60, n)
-	prices := make([]float64, period)
-	volumes := make([]float64, period)
-
-	for i := 0; i < period; i++ {
-		idx := n - period + i
-		// 使用典型价格
-		prices[i] = (data[idx].High + data[idx].Low + data[idx].Close) / 3
-		volumes[i] = data[idx].Volume
-	}
+	// 直接在尾部窗口上计算，典型价格 = (最高+最低+收盘)/3
+	window := data[n-min(60, n):]
 
 	// 计算成交量加权的价格标准差
 	var sumPV, sumV float64
-	for i := 0; i < period; i++ {
-		sumPV += prices[i] * volumes[i]
-		sumV += volumes[i]
+	for _, d := range window {
+		sumPV += (d.High + d.Low + d.Close) / 3 * d.Volume
+		sumV += d.Volume
 	}
 	avgPrice := sumPV / sumV
 
 	var sumSquares float64
-	for i := 0; i < period; i++ {
-		diff := prices[i] - avgPrice
-		sumSquares += diff * diff * volumes[i]
+	for _, d := range window {
+		diff := (d.High+d.Low+d.Close)/3 - avgPrice
+		sumSquares += diff * diff * d.Volume
 	}
 	stdDev := math.Sqrt(sumSquares / sumV)
 
@@ -1348,8 +1338,9 @@ func calculateIndexInfluence(ind *Indicators, stockData []KlineData, indexData [
 
 	// 2. 计算大盘趋势（使用MA5和MA20）
 	if len(indexData) >= 20 {
-		indexCloses := make([]float64, len(indexData))
-		for i, d := range indexData {
+		// MA20只需要最后20根K线
+		indexCloses := make([]float64, 20)
+		for i, d := range indexData[len(indexData)-20:] {
 			indexCloses[i] = d.Close
 		}
 		indexMA5 := calculateMA(indexCloses, 5)
@@ -32,14 +32,77 @@ type KlineResponse struct {
 	Data   []KlineData `json:"data"`
 }
 
+// KlineColumns 列式K线数据（每个字段一个数组，避免每根K线重复字段名，响应体更小）
+type KlineColumns struct {
+	Date     []string  `json:"date"`
+	Open     []float64 `json:"open"`
+	Close    []float64 `json:"close"`
+	High     []float64 `json:"high"`
+	Low      []float64 `json:"low"`
+	Volume   []float64 `json:"volume"`
+	Amount   []float64 `json:"amount"`
+	Turnover []float64 `json:"turnover"`
+}
+
+// KlineColumnsResponse 列式K线响应（/kline?format=columnar）
+type KlineColumnsResponse struct {
+	Code   string       `json:"code"`
+	Name   string       `json:"name"`
+	Period string       `json:"period"`
+	Data   KlineColumns `json:"data"`
+}
+
+// Columns 将K线响应转换为列式结构（数值列共用一块内存）
+func (r *KlineResponse) Columns() *KlineColumnsResponse {
+	n := len(r.Data)
+	buf := make([]float64, 7*n)
+	col := func(i int) []float64 { return buf[i*n : (i+1)*n : (i+1)*n] }
+	cols := KlineColumns{
+		Date:     make([]string, n),
+		Open:     col(0),
+		Close:    col(1),
+		High:     col(2),
+		Low:      col(3),
+		Volume:   col(4),
+		Amount:   col(5),
+		Turnover: col(6),
+	}
+	for i, d := range r.Data {
+		cols.Date[i] = d.Date
+		cols.Open[i] = d.Open
+		cols.Close[i] = d.Close
+		cols.High[i] = d.High
+		cols.Low[i] = d.Low
+		cols.Volume[i] = d.Volume
+		cols.Amount[i] = d.Amount
+		cols.Turnover[i] = d.Turnover
+	}
+	return &KlineColumnsResponse{
+		Code:   r.Code,
+		Name:   r.Name,
+		Period: r.Period,
+		Data:   cols,
+	}
+}
+
 type klineCacheItem struct {
 	Value     *KlineResponse
 	ExpiresAt time.Time
 }
 
+// klineCall 正在进行中的K线拉取（同一key并发请求只回源一次）
+type klineCall struct {
+	done chan struct{}
+	resp *KlineResponse
+	err  error
+}
+
 var (
 	klineCacheMu sync.RWMutex
 	klineCache   = map[string]klineCacheItem{}
+
+	klineInflightMu sync.Mutex
+	klineInflight   = map[string]*klineCall{}
 )
 
 func getKlineCacheKey(code, period string) string {
@@ -105,6 +168,37 @@ func GetKlineWithRefresh(code, period string, forceRefresh bool) (*KlineResponse
 		}
 	}
 
+	return fetchKlineShared(key, code, period)
+}
+
+// fetchKlineShared 合并同一key的并发回源请求，避免缓存失效瞬间多个请求同时打到第三方
+func fetchKlineShared(key, code, period string) (*KlineResponse, error) {
+	klineInflightMu.Lock()
+	if call, ok := klineInflight[key]; ok {
+		klineInflightMu.Unlock()
+		<-call.done
+		return call.resp, call.err
+	}
+	call := &klineCall{done: make(chan struct{})}
+	klineInflight[key] = call
+	klineInflightMu.Unlock()
+
+	// 清理放在 defer 中：fetchKline 发生 panic 时也要移除 in-flight 记录并唤醒等待者，
+	// 否则后续同一 key 的请求会永久阻塞；等待者此时拿到的是下面预置的错误
+	call.err = fmt.Errorf("获取K线数据失败")
+	defer func() {
+		klineInflightMu.Lock()
+		delete(klineInflight, key)
+		klineInflightMu.Unlock()
+		close(call.done)
+	}()
+
+	call.resp, call.err = fetchKline(key, code, period)
+	return call.resp, call.err
+}
+
+// fetchKline 从第三方获取K线并写入缓存
+func fetchKline(key, code, period string) (*KlineResponse, error) {
 	// 优先尝试东方财富接口（提供换手率数据）
 	data, err := getKlineFromEM(code, period)
 	if err == nil && len(data) > 0 {
@@ -155,7 +249,8 @@ func normalizeKlineData(in []KlineData) []KlineData {
 		return in
 	}
 
-	data := make([]KlineData, 0, len(in))
+	// 输入为刚解析出的切片，原地过滤/去重，避免两次整份拷贝
+	data := in[:0]
 	for _, d := range in {
 		d.Date = normalizeKlineDate(d.Date)
 		if strings.TrimSpace(d.Date) == "" {
@@ -167,14 +262,13 @@ func normalizeKlineData(in []KlineData) []KlineData {
 		return data
 	}
 
-	sort.Slice(data, func(i, j int) bool { return data[i].Date < data[j].Date })
+	// 数据源通常已按日期升序返回，已有序时跳过排序
+	if !sort.SliceIsSorted(data, func(i, j int) bool { return data[i].Date < data[j].Date }) {
+		sort.Slice(data, func(i, j int) bool { return data[i].Date < data[j].Date })
+	}
 
-	out := make([]KlineData, 0, len(data))
-	for _, d := range data {
-		if len(out) == 0 {
-			out = append(out, d)
-			continue
-		}
+	out := data[:1]
+	for _, d := range data[1:] {
 		if out[len(out)-1].Date == d.Date {
 			out[len(out)-1] = d
 			continue
@@ -280,7 +374,7 @@ func getKlineFromSina(code, period string) ([]KlineData, error) {
 		return nil, err
 	}
 
-	var result []KlineData
+	result := make([]KlineData, 0, len(rawData))
 	for _, item := range rawData {
 		open, _ := strconv.ParseFloat(item.Open, 64)
 		close, _ := strconv.ParseFloat(item.Close, 64)
@@ -354,7 +448,7 @@ func getKlineFromEM(code, period string) ([]KlineData, error) {
 		return nil, err
 	}
 
-	var result []KlineData
+	result := make([]KlineData, 0, len(emResp.Data.Klines))
 	for _, line := range emResp.Data.Klines {
 		parts := strings.Split(line, ",")
 		if len(parts) < 7 {
@@ -0,0 +1,75 @@
+package stockdata
+
+import "fmt"
+
+// SampleFeatures 相似样本库使用的特征（与 CalculateIndicators 中同名字段结果一致）
+type SampleFeatures struct {
+	RSI           float64
+	Volatility    float64
+	Change5D      float64
+	MA5Slope      float64
+	MomentumScore float64
+}
+
+// SampleFeatureCalculator 样本特征计算器
+// 样本生成需要对同一只股票的每个历史前缀计算特征，完整的 CalculateIndicators 会额外计算KDJ、
+// 情绪、主力成本、换手率并生成信号文案；这里预先提取一次收盘价/成交量列，只计算样本需要的5个特征
+type SampleFeatureCalculator struct {
+	closes  []float64
+	volumes []float64
+}
+
+// NewSampleFeatureCalculator 基于K线数据创建样本特征计算器
+func NewSampleFeatureCalculator(data []KlineData) *SampleFeatureCalculator {
+	m := len(data)
+	buf := make([]float64, 2*m)
+	c := &SampleFeatureCalculator{
+		closes:  buf[0:m:m],
+		volumes: buf[m : 2*m : 2*m],
+	}
+	for i, d := range data {
+		c.closes[i] = d.Close
+		c.volumes[i] = d.Volume
+	}
+	return c
+}
+
+// At 计算前 n 根K线（即 data[:n]）的样本特征
+func (c *SampleFeatureCalculator) At(n int) (SampleFeatures, error) {
+	if n < 1 || n > len(c.closes) {
+		return SampleFeatures{}, fmt.Errorf("K线数据为空")
+	}
+	closes := c.closes[:n]
+	volumes := c.volumes[:n]
+
+	// 综合动量评分依赖的字段，计算方式与 CalculateIndicators 保持一致
+	ind := Indicators{CurrentPrice: closes[n-1]}
+	ind.MACD, ind.Signal, ind.Hist = calculateMACD(closes)
+	ind.RSI = calculateRSI(closes, min(14, n))
+	ind.BollUpper, ind.BollMiddle, ind.BollLower = calculateBollinger(closes, min(20, n))
+	ind.Change5D = calculateChangePercent(closes, 5)
+	ind.MA5Slope = calculateMA5Slope(closes)
+
+	ind.CurrentVolume = volumes[n-1]
+	ind.VolumeMA5 = calculateMA(volumes, min(5, n))
+	if ind.VolumeMA5 > 0 {
+		ind.VolumeRatio = ind.CurrentVolume / ind.VolumeMA5
+	} else {
+		ind.VolumeRatio = 1.0
+	}
+
+	_, ind.Volatility, _ = analyzeMarketEnvironment(closes, volumes)
+
+	ind.BollBreakout = detectBollingerBreakout(closes, ind.BollUpper, ind.BollLower, ind.CurrentPrice)
+	ind.VolumeBreakout = detectVolumeBreakout(volumes, ind.VolumeRatio)
+	ind.PriceAccel = calculatePriceAcceleration(closes)
+	ind.MomentumScore = calculateMomentumScore(&ind)
+
+	return SampleFeatures{
+		RSI:           ind.RSI,
+		Volatility:    ind.Volatility,
+		Change5D:      ind.Change5D,
+		MA5Slope:      ind.MA5Slope,
+		MomentumScore: ind.MomentumScore,
+	}, nil
+}
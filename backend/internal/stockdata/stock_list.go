@@ -7,6 +7,7 @@ import (
 	"log"
 	"net/http"
 	"os"
+	"path/filepath"
 	"strconv"
 	"strings"
 	"sync"
@@ -22,19 +23,45 @@ type Stock struct {
 }
 
 const (
-	stockListCacheKey = "stock:list"
-	cacheDuration     = 24 * time.Hour
+	stockListCacheKey    = "stock:list"
+	cacheDuration        = 24 * time.Hour
+	defaultStockListFile = "stock_list_cache.json"
+	// staleStockListRetryInterval 拉取失败改用过期快照时，快照在进程内的保留时长（到期后再尝试回源）
+	staleStockListRetryInterval = 10 * time.Minute
 )
 
 var (
 	stockListCache []Stock
 	stockListMutex sync.RWMutex
 	lastFetchTime  time.Time
+	// stockListIndex 代码 -> stockListCache 下标，用于O(1)查询股票信息
+	stockListIndex map[string]int
+	// stockListUpperNames 与 stockListCache 一一对应的大写名称，搜索时免去逐条转换
+	stockListUpperNames []string
 )
 
+// httpTransport 数据源共享连接池：请求集中在东财/新浪少数几个域名，
+// 默认每主机仅保留2条空闲连接，并发拉取时会频繁重新握手TLS
+var httpTransport = newHTTPTransport()
+
+func newHTTPTransport() *http.Transport {
+	t := http.DefaultTransport.(*http.Transport).Clone()
+	t.MaxIdleConns = 64
+	t.MaxIdleConnsPerHost = 32
+	t.IdleConnTimeout = 90 * time.Second
+	return t
+}
+
 // HTTPClient HTTP客户端
 var HTTPClient = &http.Client{
-	Timeout: 30 * time.Second,
+	Timeout:   30 * time.Second,
+	Transport: httpTransport,
+}
+
+// industryHTTPClient 行业查询使用更短的超时，但与 HTTPClient 共用连接池
+var industryHTTPClient = &http.Client{
+	Timeout:   5 * time.Second,
+	Transport: httpTransport,
 }
 
 func isStockdataDebug() bool {
@@ -77,9 +104,12 @@ func RefreshStockCache() ([]Stock, error) {
 	if err := getCacheProvider().Set(stockListCacheKey, newStocks, cacheDuration); err != nil {
 		return nil, fmt.Errorf("保存到缓存失败: %v", err)
 	}
+	setStockListMemCache(newStocks)
+	saveStockListToDisk(newStocks)
 
 	stockdataDebugf("股票缓存全量刷新完成: %d 只股票", len(newStocks))
-	return newStocks, nil
+	// newStocks 已作为进程内缓存共享，返回副本
+	return append([]Stock(nil), newStocks...), nil
 }
 
 // GetStockListWithRefresh 获取A股股票列表，支持强制刷新
@@ -91,24 +121,192 @@ func GetStockListWithRefresh(forceRefresh bool) ([]Stock, error) {
 	return stocks, nil
 }
 
+// getStockListMemCache 读取进程内股票列表缓存（返回共享切片，调用方不得修改）
+func getStockListMemCache() []Stock {
+	stockListMutex.RLock()
+	defer stockListMutex.RUnlock()
+	if !stockListMemCacheValidLocked() {
+		return nil
+	}
+	return stockListCache
+}
+
+// stockListMemCacheValidLocked 进程内缓存是否可用（需持有 stockListMutex）
+func stockListMemCacheValidLocked() bool {
+	return len(stockListCache) > 0 && time.Since(lastFetchTime) <= cacheDuration
+}
+
+// lookupStockMemCache 按代码从进程内缓存查询股票
+func lookupStockMemCache(code string) (Stock, bool) {
+	stockListMutex.RLock()
+	defer stockListMutex.RUnlock()
+	if !stockListMemCacheValidLocked() {
+		return Stock{}, false
+	}
+	idx, ok := stockListIndex[code]
+	if !ok {
+		return Stock{}, false
+	}
+	return stockListCache[idx], true
+}
+
+// stockUpperNames 获取与stocks一一对应的大写名称，stocks为进程内缓存时直接复用预计算结果
+func stockUpperNames(stocks []Stock) []string {
+	stockListMutex.RLock()
+	cached := stockListUpperNames
+	same := len(stockListCache) == len(stocks) && len(stocks) > 0 && &stockListCache[0] == &stocks[0]
+	stockListMutex.RUnlock()
+	if same {
+		return cached
+	}
+	return buildStockUpperNames(stocks)
+}
+
+func buildStockUpperNames(stocks []Stock) []string {
+	names := make([]string, len(stocks))
+	for i, s := range stocks {
+		names[i] = strings.ToUpper(s.Name)
+	}
+	return names
+}
+
+// setStockListMemCache 更新进程内股票列表缓存，同时重建代码索引和大写名称
+func setStockListMemCache(stocks []Stock) {
+	setStockListMemCacheAt(stocks, time.Now())
+}
+
+// setStockListMemCacheAt 同 setStockListMemCache，fetchedAt 为数据的获取时间（缓存在 fetchedAt+cacheDuration 后失效）
+func setStockListMemCacheAt(stocks []Stock, fetchedAt time.Time) {
+	if len(stocks) == 0 {
+		return
+	}
+	index := make(map[string]int, len(stocks))
+	for i, s := range stocks {
+		if _, exists := index[s.Code]; !exists {
+			index[s.Code] = i
+		}
+	}
+	upperNames := buildStockUpperNames(stocks)
+
+	stockListMutex.Lock()
+	stockListCache = stocks
+	stockListIndex = index
+	stockListUpperNames = upperNames
+	lastFetchTime = fetchedAt
+	stockListMutex.Unlock()
+}
+
+// getStockListCacheFile 股票列表本地快照文件路径
+func getStockListCacheFile() string {
+	if p := strings.TrimSpace(os.Getenv("STOCK_LIST_CACHE_FILE")); p != "" {
+		return p
+	}
+	return defaultStockListFile
+}
+
+// loadStockListFromDisk 读取股票列表本地快照及其写入时间，maxAge>0 时超过该时长的快照视为过期
+func loadStockListFromDisk(maxAge time.Duration) ([]Stock, time.Time) {
+	path := getStockListCacheFile()
+	fi, err := os.Stat(path)
+	if err != nil {
+		return nil, time.Time{}
+	}
+	if maxAge > 0 && time.Since(fi.ModTime()) > maxAge {
+		return nil, time.Time{}
+	}
+	b, err := os.ReadFile(path)
+	if err != nil {
+		stockdataErrorf("读取股票列表快照失败: %v", err)
+		return nil, time.Time{}
+	}
+	var stocks []Stock
+	if err := json.Unmarshal(b, &stocks); err != nil {
+		stockdataErrorf("解析股票列表快照失败: %v", err)
+		return nil, time.Time{}
+	}
+	return stocks, fi.ModTime()
+}
+
+// saveStockListToDisk 写入股票列表本地快照（先写临时文件再重命名，避免读到写了一半的文件）
+func saveStockListToDisk(stocks []Stock) {
+	if len(stocks) == 0 {
+		return
+	}
+	path := getStockListCacheFile()
+	b, err := json.Marshal(stocks)
+	if err != nil {
+		stockdataErrorf("序列化股票列表快照失败: %v", err)
+		return
+	}
+	// 临时文件名唯一：定时刷新与请求路径的刷新可能同时写快照
+	tmp, err := os.CreateTemp(filepath.Dir(path), filepath.Base(path)+".*.tmp")
+	if err != nil {
+		stockdataErrorf("写入股票列表快照失败: %v", err)
+		return
+	}
+	tmpPath := tmp.Name()
+	_, werr := tmp.Write(b)
+	if cerr := tmp.Close(); werr == nil {
+		werr = cerr
+	}
+	if werr != nil {
+		stockdataErrorf("写入股票列表快照失败: %v", werr)
+		_ = os.Remove(tmpPath)
+		return
+	}
+	if err := os.Rename(tmpPath, path); err != nil {
+		stockdataErrorf("保存股票列表快照失败: %v", err)
+		_ = os.Remove(tmpPath)
+		return
+	}
+	stockdataDebugf("股票列表快照已保存: %s (%d 只)", path, len(stocks))
+}
+
 // GetStockListWithRefresh2 获取A股股票列表，返回是否来自缓存
 func GetStockListWithRefresh2(forceRefresh bool) ([]Stock, bool) {
-	// 1. 尝试从Redis获取缓存
+	stocks, fromCache := getStockListWithRefresh(forceRefresh)
+	if len(stocks) == 0 {
+		return nil, fromCache
+	}
+	// 返回副本，避免调用方（如排序）修改进程内缓存
+	return append([]Stock(nil), stocks...), fromCache
+}
+
+// getStockListWithRefresh 获取A股股票列表（返回共享切片，调用方不得修改）
+func getStockListWithRefresh(forceRefresh bool) ([]Stock, bool) {
 	if !forceRefresh {
+		// 1. 进程内缓存（避免每次查询都从Redis反序列化全量列表）
+		if cachedStocks := getStockListMemCache(); len(cachedStocks) > 0 {
+			return cachedStocks, true
+		}
+
+		// 2. 尝试从Redis获取缓存
 		var cachedStocks []Stock
 		if err := getCacheProvider().Get(stockListCacheKey, &cachedStocks); err == nil && len(cachedStocks) > 0 {
 			stockdataDebugf("从Redis缓存获取 %d 只股票", len(cachedStocks))
+			setStockListMemCache(cachedStocks)
 			return cachedStocks, true
 		}
+
+		// 3. 本地快照（进程重启且Redis不可用时，免去冷启动全量拉取）
+		// 快照按写入时间计算剩余有效期，不因重新载入而延长
+		if diskStocks, savedAt := loadStockListFromDisk(cacheDuration); len(diskStocks) > 0 {
+			if remaining := cacheDuration - time.Since(savedAt); remaining > 0 {
+				stockdataDebugf("从本地快照获取 %d 只股票（剩余有效期 %s）", len(diskStocks), remaining.Truncate(time.Minute))
+				_ = getCacheProvider().Set(stockListCacheKey, diskStocks, remaining)
+				setStockListMemCacheAt(diskStocks, savedAt)
+				return diskStocks, true
+			}
+		}
 	}
 
-	// 2. 获取现有缓存用于增量更新
+	// 4. 获取现有缓存用于增量更新
 	var existingStocks []Stock
 	if forceRefresh {
 		getCacheProvider().Get(stockListCacheKey, &existingStocks)
 	}
 
-	// 3. 从数据源获取新数据
+	// 5. 从数据源获取新数据
 	newStocks := fetchAndMergeStocks()
 
 	if len(newStocks) == 0 {
@@ -116,10 +314,22 @@ func GetStockListWithRefresh2(forceRefresh bool) ([]Stock, bool) {
 		if len(existingStocks) > 0 {
 			return existingStocks, true
 		}
+		// 缓存也没有时，退回本地快照（即使已过期，也好过返回空列表）
+		if diskStocks, savedAt := loadStockListFromDisk(0); len(diskStocks) > 0 {
+			stockdataErrorf("获取股票列表失败，使用本地快照 (%d 只)", len(diskStocks))
+			// 写入进程内缓存供 GetStockInfo 等查询使用，但只保留 staleStockListRetryInterval，
+			// 到期后再回源，避免每次查询都重新全量拉取；过期快照不写回 Redis
+			fetchedAt := time.Now().Add(staleStockListRetryInterval - cacheDuration)
+			if savedAt.After(fetchedAt) {
+				fetchedAt = savedAt
+			}
+			setStockListMemCacheAt(diskStocks, fetchedAt)
+			return diskStocks, true
+		}
 		return nil, false
 	}
 
-	// 4. 增量合并
+	// 6. 增量合并
 	var finalStocks []Stock
 	if len(existingStocks) > 0 {
 		stockMap := make(map[string]Stock)
@@ -146,6 +356,8 @@ func GetStockListWithRefresh2(forceRefresh bool) ([]Stock, bool) {
 	if err := getCacheProvider().Set(stockListCacheKey, finalStocks, cacheDuration); err != nil {
 		log.Printf("保存到缓存失败: %v", err)
 	}
+	setStockListMemCache(finalStocks)
+	saveStockListToDisk(finalStocks)
 
 	return finalStocks, false
 }
@@ -181,7 +393,7 @@ func fetchAndMergeStocks() []Stock {
 	}
 
 	// 转换为数组
-	var result []Stock
+	result := make([]Stock, 0, len(stockMap))
 	for _, s := range stockMap {
 		result = append(result, s)
 	}
@@ -337,7 +549,7 @@ func fetchSinaStocks(market string, page int) ([]Stock, error) {
 		return nil, fmt.Errorf("新浪API解析失败: %v", err)
 	}
 
-	var stocks []Stock
+	stocks := make([]Stock, 0, len(items))
 	for _, item := range items {
 		code := strings.TrimPrefix(item.Symbol, "sh")
 		code = strings.TrimPrefix(code, "sz")
@@ -453,12 +665,13 @@ func fetchEMStocksPage(fs string, page, pageSize int) ([]Stock, error) {
 			return nil, err
 		}
 		// 从对象转换为数组
+		diffList = make([]DiffItem, 0, len(diffMap))
 		for _, item := range diffMap {
 			diffList = append(diffList, item)
 		}
 	}
 
-	var stocks []Stock
+	stocks := make([]Stock, 0, len(diffList))
 	for _, item := range diffList {
 		stocks = append(stocks, Stock{
 			Code:     item.F12,
@@ -494,7 +707,7 @@ type SearchStocksResult struct {
 // SearchStocksWithRefresh 搜索股票，支持强制刷新，返回是否来自缓存
 // 第三个返回值表示刷新是否失败（用于前端显示错误提示）
 func SearchStocksWithRefresh(keyword string, forceRefresh bool) ([]Stock, bool, bool) {
-	allStocks, fromCache := GetStockListWithRefresh2(forceRefresh)
+	allStocks, fromCache := getStockListWithRefresh(forceRefresh)
 
 	// 如果是刷新操作但返回的是缓存数据，说明第三方接口获取失败
 	refreshFailed := forceRefresh && fromCache
@@ -506,7 +719,7 @@ func SearchStocksWithRefresh(keyword string, forceRefresh bool) ([]Stock, bool,
 	stockdataDebugf("股票总数: %d, 搜索关键词: %s", len(allStocks), keyword)
 
 	if keyword == "" {
-		return allStocks, fromCache, refreshFailed
+		return append([]Stock(nil), allStocks...), fromCache, refreshFailed
 	}
 
 	keyword = strings.ToUpper(keyword)
@@ -517,8 +730,9 @@ func SearchStocksWithRefresh(keyword string, forceRefresh bool) ([]Stock, bool,
 	var prefixMatch []Stock    // 代码或名称前缀匹配
 	var containMatch []Stock   // 代码或名称包含匹配
 
-	for _, s := range allStocks {
-		upperName := strings.ToUpper(s.Name)
+	upperNames := stockUpperNames(allStocks)
+	for i, s := range allStocks {
+		upperName := upperNames[i]
 
 		// 精确匹配（代码完全匹配）
 		if s.Code == keyword {
@@ -537,6 +751,9 @@ func SearchStocksWithRefresh(keyword string, forceRefresh bool) ([]Stock, bool,
 
 	// 合并结果，按优先级排序
 	var result []Stock
+	if total := len(exactMatch) + len(nameExactMatch) + len(prefixMatch) + len(containMatch); total > 0 {
+		result = make([]Stock, 0, total)
+	}
 	result = append(result, exactMatch...)
 	result = append(result, nameExactMatch...)
 	result = append(result, prefixMatch...)
@@ -552,11 +769,19 @@ func SearchStocksWithRefresh(keyword string, forceRefresh bool) ([]Stock, bool,
 
 // GetStockInfo 获取股票信息
 func GetStockInfo(code string) (*Stock, error) {
-	allStocks, err := GetStockList()
-	if err != nil {
-		return nil, err
+	if s, ok := lookupStockMemCache(code); ok {
+		return &s, nil
 	}
 
+	// 进程内缓存未就绪时加载列表（加载成功会重建索引）
+	allStocks, _ := getStockListWithRefresh(false)
+	if len(allStocks) == 0 {
+		return nil, fmt.Errorf("获取股票列表失败")
+	}
+	if s, ok := lookupStockMemCache(code); ok {
+		return &s, nil
+	}
+	// 返回的列表未进入进程内索引（如上游失败时的兜底数据），直接遍历查找
 	for _, s := range allStocks {
 		if s.Code == code {
 			return &s, nil
@@ -584,6 +809,11 @@ func GetStockIndustry(code string) string {
 	}
 
 	// 缓存中没有行业信息，从东方财富单独获取
+	return FetchStockIndustry(code)
+}
+
+// FetchStockIndustry 直接从东方财富获取股票行业（调用方已查过本地列表时使用，免去重复查询）
+func FetchStockIndustry(code string) string {
 	market := "0" // 深市
 	if strings.HasPrefix(code, "6") {
 		market = "1" // 沪市
@@ -595,8 +825,7 @@ func GetStockIndustry(code string) string {
 	req.Header.Set("User-Agent", "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36")
 	req.Header.Set("Referer", "https://quote.eastmoney.com")
 
-	client := &http.Client{Timeout: 5 * time.Second}
-	resp, err := client.Do(req)
+	resp, err := industryHTTPClient.Do(req)
 	if err != nil {
 		return ""
 	}
@@ -7,6 +7,7 @@ import (
 	"path/filepath"
 	"strconv"
 	"strings"
+	"sync"
 	"time"
 
 	_ "modernc.org/sqlite"
@@ -75,12 +76,131 @@ func EnsureSchema(db *sql.DB) error {
 	return nil
 }
 
+// readOnlyDBIdleTimeout 只读连接空闲多久后关闭，避免长期占用数据库文件
+// （Windows 下文件被打开时无法 rename 覆盖）；查询频繁时连接不会空闲，重建需借助重建标记
+const readOnlyDBIdleTimeout = 10 * time.Second
+
+// rebuildMarkerMaxAge 重建标记的有效期，超过视为重建进程异常退出后的残留，忽略之
+const rebuildMarkerMaxAge = 10 * time.Minute
+
+// RebuildMarkerPath 样本库重建标记文件路径
+// 样本生成是独立进程，rename 覆盖前创建该文件；后端检索时发现标记即暂停检索并立即关闭只读连接
+func RebuildMarkerPath(dbPath string) string {
+	return dbPath + ".rebuilding"
+}
+
+func rebuildInProgress(dbPath string) bool {
+	fi, err := os.Stat(RebuildMarkerPath(dbPath))
+	return err == nil && time.Since(fi.ModTime()) < rebuildMarkerMaxAge
+}
+
+type readOnlyDB struct {
+	db   *sql.DB
+	info os.FileInfo
+	refs int
+	// gen 每次引用计数变化时递增，用于作废已过期的空闲关闭定时器
+	gen int
+	// closing 已移出缓存，最后一次归还时立即关闭
+	closing bool
+	closed  bool
+}
+
+var (
+	readOnlyDBMu    sync.Mutex
+	readOnlyDBCache = map[string]*readOnlyDB{}
+)
+
+// acquireReadOnly 获取（复用）同一路径的只读连接池，使用完必须调用 releaseReadOnly；
+// 样本库被重建（临时文件rename覆盖）后文件已不是同一个，此时旧连接移出缓存，待其空闲后由定时器关闭
+func acquireReadOnly(dbPath string, info os.FileInfo) (*readOnlyDB, error) {
+	readOnlyDBMu.Lock()
+	defer readOnlyDBMu.Unlock()
+
+	if c, ok := readOnlyDBCache[dbPath]; ok {
+		if os.SameFile(c.info, info) {
+			c.refs++
+			c.gen++
+			return c, nil
+		}
+		delete(readOnlyDBCache, dbPath)
+	}
+
+	db, err := sql.Open("sqlite", fmt.Sprintf("file:%s?mode=ro", filepath.ToSlash(dbPath)))
+	if err != nil {
+		return nil, err
+	}
+	c := &readOnlyDB{db: db, info: info, refs: 1}
+	readOnlyDBCache[dbPath] = c
+	return c, nil
+}
+
+// releaseReadOnly 归还连接；引用归零后空闲超时即关闭（已标记 closing 的立即关闭）
+func releaseReadOnly(dbPath string, c *readOnlyDB) {
+	readOnlyDBMu.Lock()
+	c.refs--
+	c.gen++
+	if c.refs > 0 || c.closed {
+		readOnlyDBMu.Unlock()
+		return
+	}
+	if c.closing {
+		c.closed = true
+		readOnlyDBMu.Unlock()
+		_ = c.db.Close()
+		return
+	}
+	gen := c.gen
+	readOnlyDBMu.Unlock()
+	time.AfterFunc(readOnlyDBIdleTimeout, func() { closeIdleReadOnly(dbPath, c, gen) })
+}
+
+// closeReadOnly 将连接移出缓存并尽快关闭：无人使用时立即关闭，否则在最后一次归还时关闭
+func closeReadOnly(dbPath string) {
+	readOnlyDBMu.Lock()
+	c, ok := readOnlyDBCache[dbPath]
+	if !ok {
+		readOnlyDBMu.Unlock()
+		return
+	}
+	delete(readOnlyDBCache, dbPath)
+	c.closing = true
+	if c.refs > 0 || c.closed {
+		readOnlyDBMu.Unlock()
+		return
+	}
+	c.closed = true
+	readOnlyDBMu.Unlock()
+
+	_ = c.db.Close()
+}
+
+func closeIdleReadOnly(dbPath string, c *readOnlyDB, gen int) {
+	readOnlyDBMu.Lock()
+	// 定时器到期前又被获取/归还过，交给最新的定时器处理
+	if c.refs > 0 || c.gen != gen || c.closed {
+		readOnlyDBMu.Unlock()
+		return
+	}
+	c.closed = true
+	if readOnlyDBCache[dbPath] == c {
+		delete(readOnlyDBCache, dbPath)
+	}
+	readOnlyDBMu.Unlock()
+
+	_ = c.db.Close()
+}
+
 func QueryTopK(dbPath string, ind Indicators, topK int) ([]Sample, error) {
 	if topK <= 0 {
 		return nil, nil
 	}
 	dbPath = ResolvePath(dbPath)
-	if _, err := os.Stat(dbPath); err != nil {
+	if rebuildInProgress(dbPath) {
+		closeReadOnly(dbPath)
+		return nil, fmt.Errorf("样本库正在重建: %s", dbPath)
+	}
+	info, err := os.Stat(dbPath)
+	if err != nil {
 		return nil, err
 	}
 
@@ -98,11 +218,12 @@ func QueryTopK(dbPath string, ind Indicators, topK int) ([]Sample, error) {
 		}
 	}
 
-	db, err := sql.Open("sqlite", fmt.Sprintf("file:%s?mode=ro", filepath.ToSlash(dbPath)))
+	handle, err := acquireReadOnly(dbPath, info)
 	if err != nil {
 		return nil, err
 	}
-	defer db.Close()
+	defer releaseReadOnly(dbPath, handle)
+	db := handle.db
 
 	queryBase := `
 SELECT
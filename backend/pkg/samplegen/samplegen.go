@@ -8,6 +8,7 @@ import (
 	"log"
 	"os"
 	"path/filepath"
+	"runtime"
 	"sort"
 	"strconv"
 	"strings"
@@ -243,14 +244,15 @@ INSERT OR REPLACE INTO llm_samples(
 		}
 
 		stockStartWritten := written
+		features := stockdata.NewSampleFeatureCalculator(kline.Data)
 
 		for i := start; i <= end; i++ {
 			baseClose := kline.Data[i-1].Close
 			if baseClose <= 0 {
 				continue
 			}
-			ind, err := stockdata.CalculateIndicators(kline.Data[:i])
-			if err != nil || ind == nil {
+			ind, err := features.At(i)
+			if err != nil {
 				continue
 			}
 
@@ -298,7 +300,7 @@ INSERT OR REPLACE INTO llm_samples(
 		_ = os.Remove(tmpPath)
 		return 0, err
 	}
-	if err := os.Rename(tmpPath, opts.OutputPath); err != nil {
+	if err := renameSampleDB(tmpPath, opts.OutputPath); err != nil {
 		_ = os.Remove(tmpPath)
 		return 0, err
 	}
@@ -306,6 +308,40 @@ INSERT OR REPLACE INTO llm_samples(
 	return written, nil
 }
 
+// renameSampleDB 用重建好的临时库覆盖样本库
+// Windows 下目标文件被其他进程（后端检索样本时）打开时 rename 会失败。覆盖前先创建重建标记，
+// 后端下次检索时会关闭只读连接并暂停检索，无检索时连接空闲约10秒后也会关闭，因此失败时等待重试。
+// 仍可能失败：后端同一时刻有检索正在执行且持续超过重试窗口，或后端版本不识别重建标记；
+// 重试次数与间隔可通过 LLM_SAMPLE_GEN_RENAME_RETRY_COUNT / LLM_SAMPLE_GEN_RENAME_RETRY_INTERVAL_SEC 调整
+// （总时长需小于后端标记有效期10分钟）。其他平台 rename 不受打开的文件影响，失败直接返回错误
+func renameSampleDB(tmpPath, dstPath string) error {
+	attempts := getEnvInt("LLM_SAMPLE_GEN_RENAME_RETRY_COUNT", 10)
+	if attempts < 1 {
+		attempts = 1
+	}
+	interval := time.Duration(getEnvInt("LLM_SAMPLE_GEN_RENAME_RETRY_INTERVAL_SEC", 2)) * time.Second
+
+	marker := llmsamples.RebuildMarkerPath(dstPath)
+	if err := os.WriteFile(marker, []byte(time.Now().Format(time.RFC3339)), 0o644); err != nil {
+		samplegenErrorf("create rebuild marker %s failed: %v", marker, err)
+	} else {
+		defer os.Remove(marker)
+	}
+
+	var err error
+	for i := 0; i < attempts; i++ {
+		if err = os.Rename(tmpPath, dstPath); err == nil {
+			return nil
+		}
+		if runtime.GOOS != "windows" {
+			return err
+		}
+		samplegenErrorf("rename %s -> %s failed (attempt %d/%d, file may be in use): %v", tmpPath, dstPath, i+1, attempts, err)
+		time.Sleep(interval)
+	}
+	return err
+}
+
 func generateIncremental(opts Options) (int, error) {
 	samplegenInfof("start: mode=incremental, output=%s, max_stocks=%d, days=%d, min_history=%d, debug=%v", opts.OutputPath, opts.MaxStocks, opts.DaysPerStock, opts.MinHistoryLen, opts.Debug)
 	if err := os.MkdirAll(filepath.Dir(opts.OutputPath), 0o755); err != nil {
@@ -433,14 +469,15 @@ INSERT OR REPLACE INTO llm_samples(
 		}
 
 		stockStartWritten := written
+		features := stockdata.NewSampleFeatureCalculator(kline.Data)
 
 		for i := start; i <= end; i++ {
 			baseClose := kline.Data[i-1].Close
 			if baseClose <= 0 {
 				continue
 			}
-			ind, err := stockdata.CalculateIndicators(kline.Data[:i])
-			if err != nil || ind == nil {
+			ind, err := features.At(i)
+			if err != nil {
 				continue
 			}
 
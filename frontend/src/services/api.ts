@@ -1,7 +1,9 @@
 import axios from "axios";
 import type {
   Stock,
+  KlineData,
   KlineResponse,
+  KlineColumnsResponse,
   PredictRequest,
   PredictResponse,
   TradeSimulateRequest,
@@ -51,14 +53,31 @@ export async function getKline(
   code: string,
   period: string = "daily"
 ): Promise<KlineResponse> {
-  const response = await api.get(`/stocks/${code}/kline`, {
+  // 使用列式格式传输（响应体更小），在客户端还原为逐条记录
+  const response = await api.get<KlineResponse | KlineColumnsResponse>(`/stocks/${code}/kline`, {
     params: {
       period,
+      format: "columnar",
       // 添加时间戳避免浏览器缓存
       t: Date.now(),
     },
   });
-  return response.data;
+  // 不支持 format 参数的后端仍返回逐条记录
+  if (Array.isArray(response.data.data)) {
+    return response.data as KlineResponse;
+  }
+  const { data: cols, ...meta } = response.data as KlineColumnsResponse;
+  const data: KlineData[] = cols.date.map((date, i) => ({
+    date,
+    open: cols.open[i],
+    close: cols.close[i],
+    high: cols.high[i],
+    low: cols.low[i],
+    volume: cols.volume[i],
+    amount: cols.amount[i],
+    turnover: cols.turnover?.[i],
+  }));
+  return { ...meta, data };
 }
 
 // 股票预测
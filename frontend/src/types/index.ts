@@ -15,6 +15,7 @@ export interface KlineData {
   low: number;
   volume: number;
   amount: number;
+  turnover?: number; // 换手率（%），新浪备用数据源为0
 }
 
 // K线响应
@@ -25,6 +26,23 @@ export interface KlineResponse {
   data: KlineData[];
 }
 
+// 列式K线响应（/kline?format=columnar，每个字段一个数组）
+export interface KlineColumnsResponse {
+  code: string;
+  name: string;
+  period: string;
+  data: {
+    date: string[];
+    open: number[];
+    close: number[];
+    high: number[];
+    low: number[];
+    volume: number[];
+    amount: number[];
+    turnover?: number[];
+  };
+}
+
 // 技术指标
 export interface TechnicalIndicators {
   ma5: number;
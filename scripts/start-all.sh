@@ -11,7 +11,7 @@ PROJECT_DIR="$(dirname "$SCRIPT_DIR")"
 # 启动 Golang 后端服务
 echo "[1/2] 启动 Golang 后端服务..."
 cd "$PROJECT_DIR/backend"
-go run cmd/server/main.go &
+go run -tags=go_json cmd/server/main.go &
 GO_PID=$!
 echo "Golang 后端 PID: $GO_PID"
 
@@ -12,4 +12,4 @@ if [ -f ".env" ]; then
 fi
 
 mkdir -p ../rag
-LLM_SAMPLES_PATH=../rag go run cmd/server/main.go
+LLM_SAMPLES_PATH=../rag go run -tags=go_json cmd/server/main.go